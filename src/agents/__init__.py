@@ -1,20 +0,0 @@
-"""
-Multi-Agent System for GreenPulse AI
-
-This package contains all specialized agents that work together
-to provide comprehensive carbon-aware financial services.
-"""
-
-from .master_agent import MasterAgent
-from .data_collection_agent import DataCollectionAgent
-from .risk_assessment_agent import RiskAssessmentAgent
-from .portfolio_optimization_agent import PortfolioOptimizationAgent
-from .inclusion_agent import InclusionAgent
-
-__all__ = [
-    "MasterAgent",
-    "DataCollectionAgent",
-    "RiskAssessmentAgent",
-    "PortfolioOptimizationAgent",
-    "InclusionAgent"
-]
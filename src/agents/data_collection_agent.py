@@ -1,163 +0,0 @@
-"""
-Data Collection Agent - Aggregates data from multiple sources
-
-Responsible for gathering:
-- Financial data
-- Carbon emission records
-- ESG reports
-- Satellite imagery data
-- Supply chain information
-"""
-
-import asyncio
-from typing import Dict, List, Any
-import logging
-from datetime import datetime, timedelta
-import random
-
-logger = logging.getLogger(__name__)
-
-
-class DataCollectionAgent:
-    """Collects and aggregates data from various sources."""
-    
-    def __init__(self, config: Dict[str, Any]):
-        self.config = config
-        self.data_cache = {}
-        self.cache_ttl = 3600  # 1 hour cache
-        
-    async def collect_all_data(
-        self, entity_id: str, entity_type: str
-    ) -> Dict[str, Any]:
-        """
-        Collect comprehensive data for an entity.
-        In production, this would call real APIs.
-        """
-        logger.info(f"Collecting data for {entity_type}: {entity_id}")
-        
-        # Check cache first
-        cache_key = f"{entity_type}_{entity_id}"
-        if cache_key in self.data_cache:
-            cached_data, timestamp = self.data_cache[cache_key]
-            if datetime.now() - timestamp < timedelta(seconds=self.cache_ttl):
-                logger.info("Returning cached data")
-                return cached_data
-        
-        # Simulate parallel data collection
-        financial_task = self._collect_financial_data(entity_id)
-        carbon_task = self._collect_carbon_data(entity_id)
-        esg_task = self._collect_esg_data(entity_id)
-        
-        financial_data, carbon_data, esg_data = await asyncio.gather(
-            financial_task, carbon_task, esg_task
-        )
-        
-        aggregated_data = {
-            "entity_id": entity_id,
-            "entity_type": entity_type,
-            "timestamp": datetime.now().isoformat(),
-            "financial": financial_data,
-            "carbon_emissions": carbon_data,
-            "esg_metrics": esg_data,
-            "data_quality_score": self._calculate_data_quality(
-                financial_data, carbon_data, esg_data
-            )
-        }
-        
-        # Update cache
-        self.data_cache[cache_key] = (aggregated_data, datetime.now())
-        
-        return aggregated_data
-    
-    async def _collect_financial_data(self, entity_id: str) -> Dict[str, Any]:
-        """Simulate financial data collection."""
-        await asyncio.sleep(0.1)  # Simulate API call
-        
-        # In production, this would call real financial APIs
-        return {
-            "revenue": random.randint(1000000, 10000000),
-            "profit_margin": round(random.uniform(0.05, 0.25), 3),
-            "debt_to_equity": round(random.uniform(0.3, 1.5), 2),
-            "current_ratio": round(random.uniform(1.0, 2.5), 2),
-            "credit_history_years": random.randint(1, 20),
-            "payment_defaults": random.randint(0, 3)
-        }
-    
-    async def _collect_carbon_data(self, entity_id: str) -> Dict[str, Any]:
-        """Simulate carbon emission data collection."""
-        await asyncio.sleep(0.1)
-        
-        # Simulate data from various sources
-        return {
-            "total_co2_tons": random.randint(100, 5000),
-            "scope1_emissions": random.randint(50, 2000),
-            "scope2_emissions": random.randint(30, 1500),
-            "scope3_emissions": random.randint(20, 1500),
-            "trend": round(random.uniform(-0.15, 0.10), 3),  # Negative is reduction
-            "renewable_energy_percentage": random.randint(0, 80),
-            "carbon_offset_tons": random.randint(0, 500),
-            "last_updated": datetime.now().isoformat()
-        }
-    
-    async def _collect_esg_data(self, entity_id: str) -> Dict[str, Any]:
-        """Simulate ESG metrics collection."""
-        await asyncio.sleep(0.1)
-        
-        return {
-            "environmental_score": random.randint(40, 95),
-            "social_score": random.randint(45, 90),
-            "governance_score": random.randint(50, 95),
-            "sdg_alignment": {
-                "SDG7": random.choice([True, False]),
-                "SDG8": random.choice([True, False]),
-                "SDG13": True,  # Climate action
-                "SDG17": random.choice([True, False])
-            },
-            "certifications": random.sample(
-                ["ISO14001", "B-Corp", "LEED", "Carbon Neutral"], 
-                k=random.randint(0, 3)
-            )
-        }
-    
-    async def collect_market_data(self) -> Dict[str, Any]:
-        """Collect market data for portfolio optimization."""
-        await asyncio.sleep(0.1)
-        
-        # Simulate market data
-        return {
-            "timestamp": datetime.now().isoformat(),
-            "green_bonds_yield": round(random.uniform(0.03, 0.06), 4),
-            "renewable_energy_stocks": self._generate_stock_data(5),
-            "traditional_energy_stocks": self._generate_stock_data(5),
-            "carbon_credit_price": round(random.uniform(20, 80), 2),
-            "market_volatility": round(random.uniform(0.10, 0.30), 3)
-        }
-    
-    def _generate_stock_data(self, count: int) -> List[Dict[str, Any]]:
-        """Generate sample stock data."""
-        stocks = []
-        for i in range(count):
-            stocks.append({
-                "ticker": f"STOCK{i+1}",
-                "price": round(random.uniform(50, 500), 2),
-                "expected_return": round(random.uniform(0.05, 0.15), 4),
-                "volatility": round(random.uniform(0.15, 0.35), 3),
-                "annual_co2_tons": random.randint(100, 10000)
-            })
-        return stocks
-    
-    def _calculate_data_quality(
-        self, financial: Dict, carbon: Dict, esg: Dict
-    ) -> float:
-        """Calculate overall data quality score."""
-        quality_score = 0
-        
-        # Check completeness
-        if financial and len(financial) >= 5:
-            quality_score += 33
-        if carbon and "total_co2_tons" in carbon:
-            quality_score += 33
-        if esg and len(esg) >= 4:
-            quality_score += 34
-        
-        return quality_score
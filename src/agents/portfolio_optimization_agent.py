@@ -1,273 +0,0 @@
-"""
-Portfolio Optimization Agent - Designs green investment strategies
-
-Creates optimized portfolios that balance financial returns with
-carbon footprint reduction and ESG alignment.
-"""
-
-import asyncio
-from typing import Dict, List, Any
-import logging
-import random
-
-logger = logging.getLogger(__name__)
-
-
-class PortfolioOptimizationAgent:
-    """Optimizes investment portfolios with carbon considerations."""
-    
-    def __init__(self, config: Dict[str, Any]):
-        self.config = config
-        
-    async def optimize_traditional(
-        self,
-        capital: float,
-        risk_tolerance: str,
-        target_return: float,
-        market_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Generate traditional portfolio without carbon constraints."""
-        logger.info(f"Optimizing traditional portfolio: ${capital}")
-        
-        await asyncio.sleep(0.1)  # Simulate optimization computation
-        
-        # Simulate portfolio allocation
-        assets = self._generate_traditional_assets(capital, risk_tolerance)
-        
-        portfolio_metrics = self._calculate_portfolio_metrics(assets)
-        
-        return {
-            "portfolio_type": "traditional",
-            "total_value": capital,
-            "assets": assets,
-            "expected_return": portfolio_metrics["expected_return"],
-            "volatility": portfolio_metrics["volatility"],
-            "sharpe_ratio": portfolio_metrics["sharpe_ratio"],
-            "annual_carbon_footprint": portfolio_metrics["carbon_footprint"]
-        }
-    
-    async def optimize_green(
-        self,
-        capital: float,
-        risk_tolerance: str,
-        target_return: float,
-        market_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Generate green portfolio with carbon optimization."""
-        logger.info(f"Optimizing green portfolio: ${capital}")
-        
-        await asyncio.sleep(0.1)
-        
-        # Generate green-focused assets
-        assets = self._generate_green_assets(capital, risk_tolerance)
-        
-        portfolio_metrics = self._calculate_portfolio_metrics(assets)
-        
-        # Calculate carbon neutrality timeline
-        carbon_footprint = portfolio_metrics["carbon_footprint"]
-        neutrality_years = self._estimate_neutrality_timeline(carbon_footprint)
-        
-        return {
-            "portfolio_type": "green",
-            "total_value": capital,
-            "assets": assets,
-            "expected_return": portfolio_metrics["expected_return"],
-            "volatility": portfolio_metrics["volatility"],
-            "sharpe_ratio": portfolio_metrics["sharpe_ratio"],
-            "annual_carbon_footprint": carbon_footprint,
-            "carbon_neutrality_timeline_years": neutrality_years,
-            "sdg_alignment_score": portfolio_metrics["sdg_score"]
-        }
-    
-    def _generate_traditional_assets(
-        self, capital: float, risk_tolerance: str
-    ) -> List[Dict[str, Any]]:
-        """Generate traditional asset allocation."""
-        assets = []
-        
-        # Asset allocation based on risk tolerance
-        if risk_tolerance == "conservative":
-            allocations = [
-                ("Bonds", 0.60, 0.04, 0.05, 500),
-                ("Large Cap Stocks", 0.25, 0.08, 0.15, 2000),
-                ("Real Estate", 0.10, 0.06, 0.12, 1500),
-                ("Cash", 0.05, 0.01, 0.02, 0)
-            ]
-        elif risk_tolerance == "aggressive":
-            allocations = [
-                ("Growth Stocks", 0.50, 0.12, 0.25, 3000),
-                ("Tech Stocks", 0.25, 0.15, 0.30, 2500),
-                ("Emerging Markets", 0.15, 0.10, 0.28, 3500),
-                ("Commodities", 0.10, 0.08, 0.22, 4000)
-            ]
-        else:  # moderate
-            allocations = [
-                ("Index Funds", 0.40, 0.08, 0.15, 2000),
-                ("Bonds", 0.30, 0.04, 0.06, 500),
-                ("Stocks", 0.20, 0.10, 0.18, 2500),
-                ("Alternatives", 0.10, 0.07, 0.20, 1800)
-            ]
-        
-        for name, weight, ret, vol, carbon in allocations:
-            assets.append({
-                "name": name,
-                "type": "traditional",
-                "allocation": weight,
-                "value": round(capital * weight, 2),
-                "expected_return": ret,
-                "volatility": vol,
-                "annual_co2_tons": carbon * weight
-            })
-        
-        return assets
-    
-    def _generate_green_assets(
-        self, capital: float, risk_tolerance: str
-    ) -> List[Dict[str, Any]]:
-        """Generate green asset allocation."""
-        assets = []
-        
-        # Green-focused allocation
-        if risk_tolerance == "conservative":
-            allocations = [
-                ("Green Bonds", 0.50, 0.045, 0.06, 50),
-                ("Renewable Energy Funds", 0.25, 0.07, 0.12, 100),
-                ("ESG Index Funds", 0.15, 0.065, 0.10, 200),
-                ("Sustainable Real Estate", 0.10, 0.055, 0.09, 150)
-            ]
-        elif risk_tolerance == "aggressive":
-            allocations = [
-                ("Clean Tech Stocks", 0.40, 0.13, 0.24, 150),
-                ("Solar Energy Companies", 0.25, 0.14, 0.26, 80),
-                ("Electric Vehicle Sector", 0.20, 0.12, 0.23, 200),
-                ("Carbon Credit Futures", 0.15, 0.10, 0.28, 50)
-            ]
-        else:  # moderate
-            allocations = [
-                ("ESG Equity Funds", 0.35, 0.085, 0.14, 180),
-                ("Green Bonds", 0.30, 0.045, 0.06, 50),
-                ("Renewable Infrastructure", 0.20, 0.075, 0.11, 120),
-                ("Sustainable Agriculture", 0.15, 0.070, 0.13, 100)
-            ]
-        
-        for name, weight, ret, vol, carbon in allocations:
-            assets.append({
-                "name": name,
-                "type": "green",
-                "allocation": weight,
-                "value": round(capital * weight, 2),
-                "expected_return": ret,
-                "volatility": vol,
-                "annual_co2_tons": carbon * weight,
-                "esg_rating": random.choice(["AA", "AAA"]),
-                "sdg_aligned": True
-            })
-        
-        return assets
-    
-    def _calculate_portfolio_metrics(
-        self, assets: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
-        """Calculate portfolio-level metrics."""
-        total_return = sum(
-            asset["expected_return"] * asset["allocation"] 
-            for asset in assets
-        )
-        
-        # Simplified volatility calculation
-        total_volatility = sum(
-            asset["volatility"] * asset["allocation"] 
-            for asset in assets
-        )
-        
-        # Sharpe ratio (assuming 2% risk-free rate)
-        risk_free_rate = 0.02
-        sharpe_ratio = (total_return - risk_free_rate) / total_volatility if total_volatility > 0 else 0
-        
-        # Total carbon footprint
-        carbon_footprint = sum(
-            asset.get("annual_co2_tons", 0) 
-            for asset in assets
-        )
-        
-        # SDG alignment score (for green portfolios)
-        sdg_score = sum(
-            asset.get("allocation", 0) * 100 
-            for asset in assets 
-            if asset.get("sdg_aligned", False)
-        )
-        
-        return {
-            "expected_return": round(total_return, 4),
-            "volatility": round(total_volatility, 4),
-            "sharpe_ratio": round(sharpe_ratio, 3),
-            "carbon_footprint": round(carbon_footprint, 2),
-            "sdg_score": round(sdg_score, 2)
-        }
-    
-    def _estimate_neutrality_timeline(self, carbon_footprint: float) -> float:
-        """
-        Estimate years to achieve carbon neutrality based on
-        portfolio carbon footprint and reduction trajectory.
-        """
-        # Assume 10% annual reduction in portfolio carbon footprint
-        annual_reduction_rate = 0.10
-        
-        if carbon_footprint <= 100:
-            return 2.0  # Already very low
-        elif carbon_footprint <= 500:
-            return 5.0
-        elif carbon_footprint <= 1000:
-            return 8.0
-        else:
-            # Calculate based on reduction rate
-            years = 0
-            current_footprint = carbon_footprint
-            while current_footprint > 100 and years < 30:
-                current_footprint *= (1 - annual_reduction_rate)
-                years += 1
-            return float(years)
-    
-    async def rebalance_portfolio(
-        self,
-        current_portfolio: Dict[str, Any],
-        market_conditions: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """
-        Dynamically rebalance portfolio based on market conditions
-        and carbon performance.
-        """
-        logger.info("Rebalancing portfolio")
-        
-        await asyncio.sleep(0.05)
-        
-        # Simulate rebalancing logic
-        rebalancing_actions = []
-        
-        for asset in current_portfolio.get("assets", []):
-            current_allocation = asset.get("allocation", 0)
-            
-            # Simple rebalancing rule
-            if current_allocation > 0.35:
-                rebalancing_actions.append({
-                    "asset": asset["name"],
-                    "action": "reduce",
-                    "from": current_allocation,
-                    "to": 0.30,
-                    "reason": "Overweight position"
-                })
-            elif current_allocation < 0.05:
-                rebalancing_actions.append({
-                    "asset": asset["name"],
-                    "action": "increase",
-                    "from": current_allocation,
-                    "to": 0.10,
-                    "reason": "Underweight position"
-                })
-        
-        return {
-            "rebalancing_required": len(rebalancing_actions) > 0,
-            "actions": rebalancing_actions,
-            "estimated_cost": len(rebalancing_actions) * 25.0,  # Transaction costs
-            "expected_improvement": "Better risk-adjusted returns"
-        }
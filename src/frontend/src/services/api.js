@@ -12,6 +12,10 @@ const api = axios.create({
 // Helper to simulate API delay
 const delay = (ms) => new Promise(resolve => setTimeout(resolve, ms));
 
+// Last greenwashing result and its ETag per company, revalidated
+// with If-None-Match so unchanged results come back as 304
+const greenwashingResults = new Map();
+
 export const apiService = {
   async getSystemStatus() {
     if (USE_MOCK) {
@@ -66,9 +70,19 @@ export const apiService = {
       await delay(1500);
       return mockGreenwashingCheck(companyId);
     }
+    const cached = greenwashingResults.get(companyId);
     const response = await api.post('/api/v1/greenwashing/check', {
       company_id: companyId
+    }, {
+      headers: cached ? { 'If-None-Match': cached.etag } : {},
+      validateStatus: (status) => (status >= 200 && status < 300) || (status === 304 && !!cached)
     });
+    if (response.status === 304) {
+      return cached.data;
+    }
+    if (response.headers.etag) {
+      greenwashingResults.set(companyId, { etag: response.headers.etag, data: response.data });
+    }
     return response.data;
   }
 };
@@ -0,0 +1,6 @@
+"""
+GreenPulse AI - Carbon Footprint-Driven Intelligent Financial Ecosystem
+
+Backend packages: the multi-agent system (greenpulse.agents) and the
+API layer serving it (greenpulse.api).
+"""
@@ -0,0 +1,36 @@
+"""
+Multi-Agent System for GreenPulse AI
+
+This package contains all specialized agents that work together
+to provide comprehensive carbon-aware financial services.
+"""
+
+import importlib
+from typing import Any
+
+# Agents are imported on first access, so that importing a light
+# submodule such as agents.cache doesn't pull in numpy and the solvers
+_AGENT_MODULES = {
+    "MasterAgent": ".master_agent",
+    "DataCollectionAgent": ".data_collection_agent",
+    "RiskAssessmentAgent": ".risk_assessment_agent",
+    "PortfolioOptimizationAgent": ".portfolio_optimization_agent",
+    "InclusionAgent": ".inclusion_agent"
+}
+
+__all__ = [
+    "MasterAgent",
+    "DataCollectionAgent",
+    "RiskAssessmentAgent",
+    "PortfolioOptimizationAgent",
+    "InclusionAgent"
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _AGENT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,80 @@
+"""
+Risk scoring kernels - Numeric core of the Risk Assessment Agent
+
+Pure float-in/float-out scoring functions, JIT-compiled with Numba
+when it is installed and run as plain Python otherwise.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Reciprocal normalizers; Numba bakes module globals in as constants, so
+# the kernels multiply instead of dividing at run time
+_INV_REVENUE_NORM = 1.0 / 100000.0
+_INV_EMISSIONS_NORM = 1.0 / 50.0
+_INV_OFFSET_NORM = 1.0 / 10.0
+
+
+@njit(cache=True)
+def traditional_score(
+    revenue: float,
+    profit_margin: float,
+    debt_to_equity: float,
+    current_ratio: float,
+    defaults: float
+) -> float:
+    """Traditional financial risk score (0-100, higher is safer)."""
+    revenue_score = min(100.0, revenue * _INV_REVENUE_NORM)  # Normalize
+    profitability_score = profit_margin * 100.0
+    leverage_score = max(0.0, 100.0 - debt_to_equity * 50.0)
+    liquidity_score = min(100.0, current_ratio * 40.0)
+    default_penalty = defaults * 15.0
+    
+    risk_score = (
+        revenue_score * 0.2 +
+        profitability_score * 0.3 +
+        leverage_score * 0.2 +
+        liquidity_score * 0.3 -
+        default_penalty
+    )
+    return max(0.0, min(100.0, risk_score))
+
+
+@njit(cache=True)
+def carbon_score(
+    total_emissions: float,
+    trend: float,
+    renewable_pct: float,
+    offset_tons: float
+) -> float:
+    """Carbon risk score (0-100, higher is riskier)."""
+    emission_intensity_risk = min(100.0, total_emissions * _INV_EMISSIONS_NORM)
+    trend_risk = max(0.0, trend * 100.0)  # Positive trend increases risk
+    transition_risk = max(0.0, 100.0 - renewable_pct)
+    offset_benefit = min(30.0, offset_tons * _INV_OFFSET_NORM)
+    
+    return max(0.0, min(100.0,
+        emission_intensity_risk * 0.4 +
+        trend_risk * 0.3 +
+        transition_risk * 0.3 -
+        offset_benefit
+    ))
+
+
+@njit(cache=True)
+def esg_score(
+    env_score: float,
+    social_score: float,
+    gov_score: float,
+    sdg_count: float
+) -> float:
+    """Weighted ESG score plus SDG alignment bonus, capped at 100."""
+    weighted = env_score * 0.4 + social_score * 0.3 + gov_score * 0.3
+    return min(100.0, weighted + sdg_count * 5.0)
@@ -0,0 +1,59 @@
+"""
+TTL Cache - Bounded in-memory cache shared by the agents
+
+Entries expire after a fixed time-to-live and the least recently
+used entry is evicted once the cache is full.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, List, Tuple
+import time
+
+
+class TTLCache:
+    """LRU cache with per-entry expiry based on monotonic time."""
+    
+    def __init__(self, ttl: float = 3600, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (hit, value), dropping the entry if it has expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        
+        timestamp, value = entry
+        if time.monotonic() - timestamp >= self.ttl:
+            del self._entries[key]
+            return False, None
+        
+        self._entries.move_to_end(key)
+        return True, value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+        Expired entries are dropped lazily when read.
+        """
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present."""
+        self._entries.pop(key, None)
+    
+    def keys(self) -> List[Hashable]:
+        """Return a snapshot of the stored keys, including expired ones."""
+        return list(self._entries)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,52 @@
+"""
+Request Clock - Shared timestamp for a single request
+
+The Master Agent stamps each request once; every agent working on
+that request reuses the same timestamp instead of reading the clock.
+Timestamps are datetime objects; they are converted to ISO strings
+only when a response is serialized. They have one-second resolution,
+so requests arriving within the same second share one datetime.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple
+from datetime import datetime
+import time
+
+_request_time: ContextVar[Optional[datetime]] = ContextVar(
+    "request_time", default=None
+)
+
+# (epoch second, datetime for that second), replaced as a whole
+_second: Tuple[int, Optional[datetime]] = (-1, None)
+
+
+def _wall_clock() -> datetime:
+    """Return the current time truncated to the second, built once per second."""
+    global _second
+    epoch_second = int(time.time())
+    cached_second, timestamp = _second
+    if cached_second != epoch_second:
+        timestamp = datetime.fromtimestamp(epoch_second)
+        _second = (epoch_second, timestamp)
+    return timestamp
+
+
+def now() -> datetime:
+    """Return the current request's timestamp, or the current time outside a request."""
+    timestamp = _request_time.get()
+    if timestamp is None:
+        return _wall_clock()
+    return timestamp
+
+
+@contextmanager
+def request_clock() -> Iterator[datetime]:
+    """Stamp the current request; tasks spawned inside inherit the timestamp."""
+    timestamp = _wall_clock()
+    token = _request_time.set(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _request_time.reset(token)
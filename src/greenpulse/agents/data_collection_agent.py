@@ -0,0 +1,297 @@
+"""
+Data Collection Agent - Aggregates data from multiple sources
+
+Responsible for gathering:
+- Financial data
+- Carbon emission records
+- ESG reports
+- Satellite imagery data
+- Supply chain information
+"""
+
+import asyncio
+from typing import Dict, List, Any, Optional
+import logging
+from urllib.parse import urlsplit
+
+import aiohttp
+import numpy as np
+
+from .cache import TTLCache
+from .clock import now
+
+logger = logging.getLogger(__name__)
+
+_CERTIFICATIONS = np.array(["ISO14001", "B-Corp", "LEED", "Carbon Neutral"])
+
+
+class DataCollectionAgent:
+    """Collects and aggregates data from various sources."""
+    
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        host_semaphores: Optional[Dict[str, asyncio.Semaphore]] = None
+    ):
+        self.config = config
+        self.data_cache = TTLCache(ttl=3600, maxsize=1024)  # 1 hour cache
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._owns_session = True
+        self._host_semaphores = {} if host_semaphores is None else host_semaphores
+        self._rng = np.random.default_rng(config.get("random_seed"))
+        self._bitpool = 0
+        self._bits_left = 0
+        
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the HTTP session shared by all data sources."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=64, ttl_dns_cache=300
+                )
+            )
+        return self._session
+    
+    async def attach_session(self, session: Optional[aiohttp.ClientSession]) -> None:
+        """
+        Use an HTTP session owned by the caller, closing any session
+        this agent created itself.
+        Passing None reverts to a lazily created session of our own.
+        """
+        await self.aclose()
+        self._session = session
+        self._owns_session = session is None
+    
+    async def aclose(self) -> None:
+        """Close the HTTP session if this agent created it."""
+        if (
+            self._owns_session
+            and self._session is not None
+            and not self._session.closed
+        ):
+            await self._session.close()
+        self._session = None
+        self._owns_session = True
+    
+    def _next_bit(self) -> bool:
+        """Return one random boolean, drawing 64 at a time from the generator."""
+        if not self._bits_left:
+            self._bitpool = int(self._rng.integers(0, 1 << 64, dtype=np.uint64))
+            self._bits_left = 64
+        bit = (self._bitpool & 1) == 1
+        self._bitpool >>= 1
+        self._bits_left -= 1
+        return bit
+    
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Bound concurrent requests to a single upstream host."""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(
+                self.config.get("max_requests_per_host", 10)
+            )
+            self._host_semaphores[host] = semaphore
+        return semaphore
+    
+    async def _fetch_json(
+        self, source: str, entity_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch data for an entity from a configured source URL.
+        Returns None when the source is not configured.
+        """
+        url = (self.config.get("data_sources") or {}).get(source)
+        if not url:
+            return None
+        
+        session = await self._get_session()
+        async with self._host_semaphore(urlsplit(url).netloc):
+            async with session.get(
+                url,
+                params={"entity_id": entity_id},
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                response.raise_for_status()
+                return await response.json()
+        
+    async def collect_all_data(
+        self, entity_id: str, entity_type: str
+    ) -> Dict[str, Any]:
+        """
+        Collect comprehensive data for an entity.
+        In production, this would call real APIs.
+        """
+        logger.info("Collecting data for %s: %s", entity_type, entity_id)
+        
+        # Check cache first
+        cache_key = (entity_type, entity_id)
+        hit, cached_data = self.data_cache.get(cache_key)
+        if hit:
+            logger.info("Returning cached data")
+            return cached_data
+        
+        # Simulate parallel data collection
+        financial_task = self._collect_financial_data(entity_id)
+        carbon_task = self._collect_carbon_data(entity_id)
+        esg_task = self._collect_esg_data(entity_id)
+        
+        # One failing source should not discard the others
+        results = await asyncio.gather(
+            financial_task, carbon_task, esg_task, return_exceptions=True
+        )
+        for source, result in zip(("financial", "carbon", "esg"), results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to collect %s data: %s", source, result)
+        financial_data, carbon_data, esg_data = (
+            {} if isinstance(result, Exception) else result
+            for result in results
+        )
+        
+        aggregated_data = {
+            "entity_id": entity_id,
+            "entity_type": entity_type,
+            "timestamp": now(),
+            "financial": financial_data,
+            "carbon_emissions": carbon_data,
+            "esg_metrics": esg_data,
+            "data_quality_score": self._calculate_data_quality(
+                financial_data, carbon_data, esg_data
+            )
+        }
+        
+        # Update cache
+        self.data_cache.set(cache_key, aggregated_data)
+        
+        return aggregated_data
+    
+    def invalidate(self, entity_id: str) -> None:
+        """Drop cached data for an entity of any type."""
+        for key in self.data_cache.keys():
+            if key[1] == entity_id:
+                self.data_cache.delete(key)
+    
+    async def _collect_financial_data(self, entity_id: str) -> Dict[str, Any]:
+        """Collect financial data, simulated when no source is configured."""
+        data = await self._fetch_json("financial", entity_id)
+        if data is not None:
+            return data
+        
+        # Simulate API call latency only when asked to
+        await asyncio.sleep(0.1 if self.config.get("simulate_latency") else 0)
+        
+        # One vectorized draw for all integer and all float fields
+        revenue, history_years, defaults = self._rng.integers(
+            [1000000, 1, 0], [10000001, 21, 4]
+        ).tolist()
+        profit_margin, debt_to_equity, current_ratio = self._rng.uniform(
+            [0.05, 0.3, 1.0], [0.25, 1.5, 2.5]
+        ).tolist()
+        
+        return {
+            "revenue": revenue,
+            "profit_margin": round(profit_margin, 3),
+            "debt_to_equity": round(debt_to_equity, 2),
+            "current_ratio": round(current_ratio, 2),
+            "credit_history_years": history_years,
+            "payment_defaults": defaults
+        }
+    
+    async def _collect_carbon_data(self, entity_id: str) -> Dict[str, Any]:
+        """Collect carbon emission data, simulated when no source is configured."""
+        data = await self._fetch_json("carbon", entity_id)
+        if data is not None:
+            return data
+        
+        await asyncio.sleep(0.1 if self.config.get("simulate_latency") else 0)
+        
+        # Simulate data from various sources
+        total, scope1, scope2, scope3, renewable_pct, offset = self._rng.integers(
+            [100, 50, 30, 20, 0, 0], [5001, 2001, 1501, 1501, 81, 501]
+        ).tolist()
+        
+        return {
+            "total_co2_tons": total,
+            "scope1_emissions": scope1,
+            "scope2_emissions": scope2,
+            "scope3_emissions": scope3,
+            "trend": round(float(self._rng.uniform(-0.15, 0.10)), 3),  # Negative is reduction
+            "renewable_energy_percentage": renewable_pct,
+            "carbon_offset_tons": offset,
+            "last_updated": now()
+        }
+    
+    async def _collect_esg_data(self, entity_id: str) -> Dict[str, Any]:
+        """Collect ESG metrics, simulated when no source is configured."""
+        data = await self._fetch_json("esg", entity_id)
+        if data is not None:
+            return data
+        
+        await asyncio.sleep(0.1 if self.config.get("simulate_latency") else 0)
+        
+        env_score, social_score, gov_score = self._rng.integers(
+            [40, 45, 50], [96, 91, 96]
+        ).tolist()
+        certifications = self._rng.choice(
+            _CERTIFICATIONS, size=int(self._rng.integers(0, 4)), replace=False
+        ).tolist()
+        
+        return {
+            "environmental_score": env_score,
+            "social_score": social_score,
+            "governance_score": gov_score,
+            "sdg_alignment": {
+                "SDG7": self._next_bit(),
+                "SDG8": self._next_bit(),
+                "SDG13": True,  # Climate action
+                "SDG17": self._next_bit()
+            },
+            "certifications": certifications
+        }
+    
+    async def collect_market_data(self) -> Dict[str, Any]:
+        """Collect market data for portfolio optimization."""
+        await asyncio.sleep(0.1 if self.config.get("simulate_latency") else 0)
+        
+        # Simulate market data
+        bonds_yield, credit_price, volatility = self._rng.uniform(
+            [0.03, 20, 0.10], [0.06, 80, 0.30]
+        ).tolist()
+        
+        return {
+            "timestamp": now(),
+            "green_bonds_yield": round(bonds_yield, 4),
+            "renewable_energy_stocks": self._generate_stock_data(5),
+            "traditional_energy_stocks": self._generate_stock_data(5),
+            "carbon_credit_price": round(credit_price, 2),
+            "market_volatility": round(volatility, 3)
+        }
+    
+    def _generate_stock_data(self, count: int) -> List[Dict[str, Any]]:
+        """Generate sample stock data."""
+        # Draw every stock's values at once
+        prices = np.round(self._rng.uniform(50, 500, size=count), 2).tolist()
+        returns = np.round(self._rng.uniform(0.05, 0.15, size=count), 4).tolist()
+        volatilities = np.round(self._rng.uniform(0.15, 0.35, size=count), 3).tolist()
+        co2_tons = self._rng.integers(100, 10001, size=count).tolist()
+        
+        return [
+            {
+                "ticker": f"STOCK{i+1}",
+                "price": prices[i],
+                "expected_return": returns[i],
+                "volatility": volatilities[i],
+                "annual_co2_tons": co2_tons[i]
+            }
+            for i in range(count)
+        ]
+    
+    def _calculate_data_quality(
+        self, financial: Dict, carbon: Dict, esg: Dict
+    ) -> float:
+        """Calculate overall data quality score."""
+        # Check completeness
+        has_financial = len(financial or ()) >= 5
+        has_carbon = "total_co2_tons" in (carbon or ())
+        has_esg = len(esg or ()) >= 4
+        
+        return float(33 * has_financial + 33 * has_carbon + 34 * has_esg)
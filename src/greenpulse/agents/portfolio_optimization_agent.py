@@ -0,0 +1,616 @@
+"""
+Portfolio Optimization Agent - Designs green investment strategies
+
+Creates optimized portfolios that balance financial returns with
+carbon footprint reduction and ESG alignment.
+"""
+
+import asyncio
+from collections import namedtuple
+from functools import lru_cache
+import importlib
+from typing import Dict, List, Any, Optional, Tuple
+import logging
+import math
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_RNG = np.random.default_rng()
+_ESG_LABELS = np.array(["AA", "AAA"])
+
+# Risk-free rate for Sharpe ratios
+_RISK_FREE = 0.02
+
+# Assumed yearly reduction of a portfolio's carbon footprint, and the log
+# of the share kept each year, log(0.9), for the neutrality timeline
+_ANNUAL_REDUCTION_RATE = 0.10
+_LOG_RETENTION = math.log(1 - _ANNUAL_REDUCTION_RATE)
+
+# Column layout of the per-asset metrics array built alongside the asset list
+_WEIGHT, _RETURN, _VOLATILITY, _CARBON, _SDG = range(5)
+
+
+def _allocation_table(
+    rows: List[Tuple[str, float, float, float, float]], sdg_aligned: bool
+) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """
+    Split (name, weight, return, volatility, carbon) rows into asset
+    names and a read-only (N, 5) metrics array with weighted carbon.
+    """
+    names = tuple(row[0] for row in rows)
+    table = np.array([row[1:] for row in rows], dtype=np.float64)
+    
+    metrics = np.empty((len(rows), 5))
+    metrics[:, :_CARBON] = table[:, :_CARBON]
+    metrics[:, _CARBON] = table[:, _CARBON] * table[:, _WEIGHT]
+    metrics[:, _SDG] = float(sdg_aligned)
+    metrics.setflags(write=False)
+    
+    return names, metrics
+
+
+# Asset allocations by risk tolerance:
+# (name, weight, expected return, volatility, annual CO2 tons at full weight)
+_TRAD_CONSERVATIVE = _allocation_table([
+    ("Bonds", 0.60, 0.04, 0.05, 500),
+    ("Large Cap Stocks", 0.25, 0.08, 0.15, 2000),
+    ("Real Estate", 0.10, 0.06, 0.12, 1500),
+    ("Cash", 0.05, 0.01, 0.02, 0)
+], sdg_aligned=False)
+_TRAD_AGGRESSIVE = _allocation_table([
+    ("Growth Stocks", 0.50, 0.12, 0.25, 3000),
+    ("Tech Stocks", 0.25, 0.15, 0.30, 2500),
+    ("Emerging Markets", 0.15, 0.10, 0.28, 3500),
+    ("Commodities", 0.10, 0.08, 0.22, 4000)
+], sdg_aligned=False)
+_TRAD_MODERATE = _allocation_table([
+    ("Index Funds", 0.40, 0.08, 0.15, 2000),
+    ("Bonds", 0.30, 0.04, 0.06, 500),
+    ("Stocks", 0.20, 0.10, 0.18, 2500),
+    ("Alternatives", 0.10, 0.07, 0.20, 1800)
+], sdg_aligned=False)
+
+_GREEN_CONSERVATIVE = _allocation_table([
+    ("Green Bonds", 0.50, 0.045, 0.06, 50),
+    ("Renewable Energy Funds", 0.25, 0.07, 0.12, 100),
+    ("ESG Index Funds", 0.15, 0.065, 0.10, 200),
+    ("Sustainable Real Estate", 0.10, 0.055, 0.09, 150)
+], sdg_aligned=True)
+_GREEN_AGGRESSIVE = _allocation_table([
+    ("Clean Tech Stocks", 0.40, 0.13, 0.24, 150),
+    ("Solar Energy Companies", 0.25, 0.14, 0.26, 80),
+    ("Electric Vehicle Sector", 0.20, 0.12, 0.23, 200),
+    ("Carbon Credit Futures", 0.15, 0.10, 0.28, 50)
+], sdg_aligned=True)
+_GREEN_MODERATE = _allocation_table([
+    ("ESG Equity Funds", 0.35, 0.085, 0.14, 180),
+    ("Green Bonds", 0.30, 0.045, 0.06, 50),
+    ("Renewable Infrastructure", 0.20, 0.075, 0.11, 120),
+    ("Sustainable Agriculture", 0.15, 0.070, 0.13, 100)
+], sdg_aligned=True)
+
+_TRAD_ALLOCS = {
+    "conservative": _TRAD_CONSERVATIVE,
+    "aggressive": _TRAD_AGGRESSIVE,
+    "moderate": _TRAD_MODERATE
+}
+_GREEN_ALLOCS = {
+    "conservative": _GREEN_CONSERVATIVE,
+    "aggressive": _GREEN_AGGRESSIVE,
+    "moderate": _GREEN_MODERATE
+}
+
+PortfolioMetrics = namedtuple(
+    "PortfolioMetrics",
+    ["expected_return", "volatility", "sharpe_ratio", "carbon_footprint", "sdg_score"]
+)
+
+
+def _allocation_for(
+    portfolio_type: str, risk_tolerance: str
+) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """
+    Look up the allocation table for a portfolio type and risk tolerance.
+    Unknown risk tolerances get the moderate allocation.
+    """
+    allocations = _GREEN_ALLOCS if portfolio_type == "green" else _TRAD_ALLOCS
+    return allocations.get(risk_tolerance, allocations["moderate"])
+
+
+def _running_total(values: np.ndarray) -> float:
+    """
+    Sum values left to right. Unlike dot() and sum(), this keeps the
+    accumulation order, so rounded metrics don't shift by a unit.
+    """
+    return float(np.cumsum(values)[-1]) if len(values) else 0.0
+
+
+def _portfolio_metrics(asset_arrays: np.ndarray) -> PortfolioMetrics:
+    """Calculate portfolio-level metrics from an (N, 5) per-asset array."""
+    weights = asset_arrays[:, _WEIGHT]
+    total_return = _running_total(asset_arrays[:, _RETURN] * weights)
+    
+    # Simplified volatility calculation
+    total_volatility = _running_total(asset_arrays[:, _VOLATILITY] * weights)
+    
+    # Sharpe ratio (assuming 2% risk-free rate)
+    sharpe_ratio = (total_return - _RISK_FREE) / total_volatility if total_volatility > 0 else 0
+    
+    # Total carbon footprint
+    carbon_footprint = _running_total(asset_arrays[:, _CARBON])
+    
+    # SDG alignment score (for green portfolios)
+    sdg_score = _running_total(weights * 100 * asset_arrays[:, _SDG])
+    
+    return PortfolioMetrics(
+        expected_return=round(total_return, 4),
+        volatility=round(total_volatility, 4),
+        sharpe_ratio=round(sharpe_ratio, 3),
+        carbon_footprint=round(carbon_footprint, 2),
+        sdg_score=round(sdg_score, 2)
+    )
+
+
+@lru_cache(maxsize=16)
+def _metrics_for_profile(portfolio_type: str, risk_tolerance: str) -> PortfolioMetrics:
+    """
+    Metrics of a profile's allocation. Weights, returns and emissions
+    are fixed per profile, so the result does not depend on capital.
+    """
+    _, asset_arrays = _allocation_for(portfolio_type, risk_tolerance)
+    return _portfolio_metrics(asset_arrays)
+
+
+# Weight on expected return against variance in the Markowitz objective
+_RETURN_APPETITE = {"conservative": 0.1, "moderate": 0.25, "aggressive": 0.5}
+
+@lru_cache(maxsize=None)
+def _optional_module(name: str) -> Optional[Any]:
+    """
+    Import an optional dependency (cvxpy, scikit-learn) on first use, or
+    return None when it is not installed. Both are slow to import and
+    only needed by the opt-in Markowitz solver.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+
+
+# Compiled Markowitz problems by (asset count, carbon capped), with the
+# parameters rebound on every solve and the weight variable
+_MARKOWITZ_PROBLEMS: Dict[Tuple[int, bool], Tuple[Any, Dict[str, Any], Any]] = {}
+
+
+def _markowitz_problem(
+    n_assets: int, carbon_capped: bool
+) -> Tuple[Any, Dict[str, Any], Any]:
+    """Build the parameterized mean-variance problem for n assets once."""
+    key = (n_assets, carbon_capped)
+    compiled = _MARKOWITZ_PROBLEMS.get(key)
+    if compiled is None:
+        cp = _optional_module("cvxpy")
+        weights = cp.Variable(n_assets, nonneg=True)
+        # Parameters enter linearly so the problem stays DPP and its
+        # canonicalization is reused: returns come pre-scaled by q, and
+        # the covariance as its upper Cholesky factor instead of quad_form
+        params = {
+            "scaled_mu": cp.Parameter(n_assets),
+            "sigma_factor": cp.Parameter((n_assets, n_assets))
+        }
+        constraints = [cp.sum(weights) == 1]
+        if carbon_capped:
+            params["carbon_vec"] = cp.Parameter(n_assets)
+            params["carbon_cap"] = cp.Parameter()
+            constraints.append(params["carbon_vec"] @ weights <= params["carbon_cap"])
+        
+        objective = cp.Minimize(
+            cp.sum_squares(params["sigma_factor"] @ weights)
+            - params["scaled_mu"] @ weights
+        )
+        compiled = (cp.Problem(objective, constraints), params, weights)
+        _MARKOWITZ_PROBLEMS[key] = compiled
+    
+    return compiled
+
+
+def _solve_markowitz(
+    mu: np.ndarray,
+    sigma: np.ndarray,
+    q: float,
+    carbon_vec: Optional[np.ndarray] = None,
+    carbon_cap: Optional[float] = None
+) -> Optional[np.ndarray]:
+    """
+    Solve min w'Σw - q·μ'w subject to sum(w) = 1, w >= 0 and, when a cap
+    is given, carbon_vec·w <= carbon_cap. Returns None if not solved.
+    """
+    cp = _optional_module("cvxpy")
+    problem, params, weights = _markowitz_problem(len(mu), carbon_cap is not None)
+    
+    params["scaled_mu"].value = q * mu
+    params["sigma_factor"].value = np.linalg.cholesky(
+        sigma + 1e-10 * np.eye(len(mu))
+    ).T
+    if carbon_cap is not None:
+        params["carbon_vec"].value = carbon_vec
+        params["carbon_cap"].value = carbon_cap
+    
+    problem.solve(solver=cp.CLARABEL, warm_start=True)
+    if problem.status not in (cp.OPTIMAL, cp.OPTIMAL_INACCURATE):
+        return None
+    
+    solved = np.clip(weights.value, 0.0, None)
+    return solved / solved.sum()
+
+
+class PortfolioOptimizationAgent:
+    """Optimizes investment portfolios with carbon considerations."""
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self._solved_allocations: Dict[
+            Tuple[str, str], Tuple[Tuple[str, ...], np.ndarray, PortfolioMetrics]
+        ] = {}
+        # Asset name -> row index and the shrunk covariance of those assets
+        self._shrunk_cov: Optional[Tuple[Dict[str, int], np.ndarray]] = None
+        self._cov_as_of: Any = None
+        
+    async def optimize_traditional(
+        self,
+        capital: float,
+        risk_tolerance: str,
+        target_return: float,
+        market_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate traditional portfolio without carbon constraints."""
+        logger.info("Optimizing traditional portfolio: $%s", capital)
+        
+        # Simulate optimization computation time only when asked to
+        await asyncio.sleep(0.1 if self.config.get("simulate_latency") else 0)
+        self._refresh_covariance(market_data)
+        
+        # Simulate portfolio allocation
+        assets = self._generate_traditional_assets(capital, risk_tolerance)
+        
+        return self._portfolio_result(
+            "traditional", capital, assets,
+            self._allocation("traditional", risk_tolerance)[2]
+        )
+    
+    async def optimize_green(
+        self,
+        capital: float,
+        risk_tolerance: str,
+        target_return: float,
+        market_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate green portfolio with carbon optimization."""
+        logger.info("Optimizing green portfolio: $%s", capital)
+        
+        await asyncio.sleep(0.1 if self.config.get("simulate_latency") else 0)
+        self._refresh_covariance(market_data)
+        
+        # Generate green-focused assets
+        assets = self._generate_green_assets(capital, risk_tolerance)
+        
+        return self._portfolio_result(
+            "green", capital, assets,
+            self._allocation("green", risk_tolerance)[2]
+        )
+    
+    def optimize_batch(
+        self,
+        capitals: np.ndarray,
+        risk_tolerances: List[str],
+        portfolio_type: str = "green",
+        market_data: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build many portfolios of one type in a single call, e.g. for
+        backtests and scenario sweeps. Results are in input order and
+        shaped like those of optimize_traditional or optimize_green.
+        """
+        capitals = np.asarray(capitals, dtype=np.float64)
+        if capitals.shape != (len(risk_tolerances),):
+            raise ValueError("capitals and risk_tolerances must have the same length")
+        self._refresh_covariance(market_data)
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(risk_tolerances)
+        tolerances = np.array(risk_tolerances, dtype=object)
+        
+        # Each distinct tolerance shares one allocation table
+        for risk_tolerance in dict.fromkeys(risk_tolerances):
+            indices = np.flatnonzero(tolerances == risk_tolerance)
+            names, asset_arrays, portfolio_metrics = self._allocation(
+                portfolio_type, risk_tolerance
+            )
+            rows = asset_arrays.tolist()
+            
+            # All asset values of the group in one (portfolios, assets) broadcast
+            group_capitals = capitals[indices]
+            values = np.round(
+                group_capitals[:, None] * asset_arrays[None, :, _WEIGHT], 2
+            ).tolist()
+            if portfolio_type == "green":
+                ratings = _ESG_LABELS[
+                    _RNG.integers(0, 2, size=(len(indices), len(names)))
+                ].tolist()
+            else:
+                ratings = [None] * len(indices)
+            
+            for index, capital, asset_values, asset_ratings in zip(
+                indices.tolist(), group_capitals.tolist(), values, ratings
+            ):
+                assets = self._assets_from_table(
+                    portfolio_type, names, rows, asset_values, asset_ratings
+                )
+                results[index] = self._portfolio_result(
+                    portfolio_type, capital, assets, portfolio_metrics
+                )
+        
+        return results
+    
+    def _allocation(
+        self, portfolio_type: str, risk_tolerance: str
+    ) -> Tuple[Tuple[str, ...], np.ndarray, PortfolioMetrics]:
+        """
+        Return asset names, the per-asset metrics array and portfolio
+        metrics for a profile. With config["portfolio_solver"] set to
+        "markowitz" the weights are solved for, otherwise the fixed
+        allocation table is used.
+        """
+        if (
+            self.config.get("portfolio_solver") != "markowitz"
+            or _optional_module("cvxpy") is None
+        ):
+            names, asset_arrays = _allocation_for(portfolio_type, risk_tolerance)
+            return names, asset_arrays, _metrics_for_profile(portfolio_type, risk_tolerance)
+        
+        key = (portfolio_type, risk_tolerance)
+        solved = self._solved_allocations.get(key)
+        if solved is None:
+            solved = self._solve_allocation(portfolio_type, risk_tolerance)
+            self._solved_allocations[key] = solved
+        return solved
+    
+    def _refresh_covariance(self, market_data: Optional[Dict[str, Any]]) -> None:
+        """
+        Re-estimate the asset covariance once per market data snapshot.
+        market_data["asset_returns"] maps asset names to equally long
+        return histories and market_data["as_of"] identifies the snapshot.
+        The estimate uses Ledoit-Wolf shrinkage, which stays well
+        conditioned on short histories.
+        """
+        if self.config.get("portfolio_solver") != "markowitz" or not market_data:
+            return
+        asset_returns = market_data.get("asset_returns")
+        as_of = market_data.get("as_of")
+        if not asset_returns or as_of is None or as_of == self._cov_as_of:
+            return
+        
+        names = list(asset_returns)
+        returns = np.array([asset_returns[name] for name in names], dtype=np.float64).T
+        sk_covariance = _optional_module("sklearn.covariance")
+        if sk_covariance is not None:
+            covariance, _ = sk_covariance.ledoit_wolf(returns)
+        else:
+            covariance = np.cov(returns, rowvar=False)
+        
+        self._shrunk_cov = ({name: i for i, name in enumerate(names)}, covariance)
+        self._cov_as_of = as_of
+        # Solutions from the previous covariance are stale
+        self._solved_allocations.clear()
+    
+    def _profile_covariance(
+        self, names: Tuple[str, ...], table: np.ndarray
+    ) -> np.ndarray:
+        """
+        Covariance of a profile's assets: the shrunk estimate when it
+        covers all of them, otherwise diagonal from the table volatilities.
+        """
+        if self._shrunk_cov is not None:
+            index, covariance = self._shrunk_cov
+            if all(name in index for name in names):
+                rows = [index[name] for name in names]
+                return covariance[np.ix_(rows, rows)]
+        return np.diag(table[:, _VOLATILITY] ** 2)
+    
+    def _solve_allocation(
+        self, portfolio_type: str, risk_tolerance: str
+    ) -> Tuple[Tuple[str, ...], np.ndarray, PortfolioMetrics]:
+        """
+        Re-weight a profile's assets with a Markowitz solve. Green
+        portfolios may not emit more than the fixed allocation does.
+        """
+        names, table = _allocation_for(portfolio_type, risk_tolerance)
+        carbon_vec = table[:, _CARBON] / table[:, _WEIGHT]  # CO2 tons at full weight
+        sigma = self._profile_covariance(names, table)
+        carbon_cap = float(table[:, _CARBON].sum()) if portfolio_type == "green" else None
+        
+        weights = _solve_markowitz(
+            table[:, _RETURN],
+            sigma,
+            _RETURN_APPETITE.get(risk_tolerance, _RETURN_APPETITE["moderate"]),
+            carbon_vec,
+            carbon_cap
+        )
+        if weights is None:
+            logger.warning(
+                "Markowitz solve failed for %s/%s, using fixed allocation",
+                portfolio_type, risk_tolerance
+            )
+            return names, table, _metrics_for_profile(portfolio_type, risk_tolerance)
+        
+        # Rounded weights can miss 1 by a few units in the last place;
+        # the largest weight absorbs the residual
+        rounded = np.round(weights, 4)
+        largest = int(np.argmax(rounded))
+        rounded[largest] = round(rounded[largest] + 1.0 - rounded.sum(), 4)
+        
+        asset_arrays = table.copy()
+        asset_arrays[:, _WEIGHT] = rounded
+        asset_arrays[:, _CARBON] = carbon_vec * asset_arrays[:, _WEIGHT]
+        asset_arrays.setflags(write=False)
+        
+        return names, asset_arrays, _portfolio_metrics(asset_arrays)
+    
+    def _portfolio_result(
+        self,
+        portfolio_type: str,
+        capital: float,
+        assets: List[Dict[str, Any]],
+        portfolio_metrics: PortfolioMetrics
+    ) -> Dict[str, Any]:
+        """Assemble the response for one generated portfolio."""
+        result = {
+            "portfolio_type": portfolio_type,
+            "total_value": capital,
+            "assets": assets,
+            "expected_return": portfolio_metrics.expected_return,
+            "volatility": portfolio_metrics.volatility,
+            "sharpe_ratio": portfolio_metrics.sharpe_ratio,
+            "annual_carbon_footprint": portfolio_metrics.carbon_footprint
+        }
+        
+        if portfolio_type == "green":
+            # Calculate carbon neutrality timeline
+            result["carbon_neutrality_timeline_years"] = (
+                self._estimate_neutrality_timeline(portfolio_metrics.carbon_footprint)
+            )
+            result["sdg_alignment_score"] = portfolio_metrics.sdg_score
+        
+        return result
+    
+    def _generate_traditional_assets(
+        self, capital: float, risk_tolerance: str
+    ) -> List[Dict[str, Any]]:
+        """Generate traditional asset allocation."""
+        # Asset allocation based on risk tolerance
+        names, asset_arrays, _ = self._allocation("traditional", risk_tolerance)
+        values = np.round(capital * asset_arrays[:, _WEIGHT], 2).tolist()
+        
+        return self._assets_from_table(
+            "traditional", names, asset_arrays.tolist(), values
+        )
+    
+    def _generate_green_assets(
+        self, capital: float, risk_tolerance: str
+    ) -> List[Dict[str, Any]]:
+        """Generate green asset allocation."""
+        # Green-focused allocation
+        names, asset_arrays, _ = self._allocation("green", risk_tolerance)
+        values = np.round(capital * asset_arrays[:, _WEIGHT], 2).tolist()
+        
+        return self._assets_from_table(
+            "green", names, asset_arrays.tolist(), values
+        )
+    
+    def _assets_from_table(
+        self,
+        portfolio_type: str,
+        names: Tuple[str, ...],
+        rows: List[List[float]],
+        values: List[float],
+        ratings: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Create the assets of one portfolio from allocation table rows
+        and their values. Green assets draw ESG ratings when none are given.
+        """
+        if portfolio_type != "green":
+            return [
+                {
+                    "name": name,
+                    "type": "traditional",
+                    "allocation": weight,
+                    "value": value,
+                    "expected_return": ret,
+                    "volatility": vol,
+                    "annual_co2_tons": co2
+                }
+                for name, (weight, ret, vol, co2, _), value in zip(names, rows, values)
+            ]
+        
+        if ratings is None:
+            # Draw every asset's ESG rating at once
+            ratings = _ESG_LABELS[_RNG.integers(0, 2, size=len(names))].tolist()
+        
+        return [
+            {
+                "name": name,
+                "type": "green",
+                "allocation": weight,
+                "value": value,
+                "expected_return": ret,
+                "volatility": vol,
+                "annual_co2_tons": co2,
+                "esg_rating": rating,
+                "sdg_aligned": True
+            }
+            for name, (weight, ret, vol, co2, _), value, rating in zip(
+                names, rows, values, ratings
+            )
+        ]
+    
+    def _estimate_neutrality_timeline(self, carbon_footprint: float) -> float:
+        """
+        Estimate years to achieve carbon neutrality based on
+        portfolio carbon footprint and reduction trajectory.
+        """
+        if carbon_footprint <= 100:
+            return 2.0  # Already very low
+        elif carbon_footprint <= 500:
+            return 5.0
+        elif carbon_footprint <= 1000:
+            return 8.0
+        else:
+            # Years until footprint * (1 - rate) ** years <= 100, capped at 30
+            years = math.ceil(math.log(100.0 / carbon_footprint) / _LOG_RETENTION)
+            return float(min(years, 30))
+    
+    async def rebalance_portfolio(
+        self,
+        current_portfolio: Dict[str, Any],
+        market_conditions: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Dynamically rebalance portfolio based on market conditions
+        and carbon performance.
+        """
+        logger.info("Rebalancing portfolio")
+        
+        await asyncio.sleep(0.05 if self.config.get("simulate_latency") else 0)
+        
+        # Simulate rebalancing logic
+        rebalancing_actions = []
+        
+        for asset in current_portfolio.get("assets", []):
+            current_allocation = asset.get("allocation", 0)
+            
+            # Simple rebalancing rule
+            if current_allocation > 0.35:
+                rebalancing_actions.append({
+                    "asset": asset["name"],
+                    "action": "reduce",
+                    "from": current_allocation,
+                    "to": 0.30,
+                    "reason": "Overweight position"
+                })
+            elif current_allocation < 0.05:
+                rebalancing_actions.append({
+                    "asset": asset["name"],
+                    "action": "increase",
+                    "from": current_allocation,
+                    "to": 0.10,
+                    "reason": "Underweight position"
+                })
+        
+        return {
+            "rebalancing_required": len(rebalancing_actions) > 0,
+            "actions": rebalancing_actions,
+            "estimated_cost": len(rebalancing_actions) * 25.0,  # Transaction costs
+            "expected_improvement": "Better risk-adjusted returns"
+        }
@@ -0,0 +1,6 @@
+"""
+API Layer for GreenPulse AI
+
+FastAPI application, background task queue and the event bus that
+shares WebSocket notifications between workers.
+"""
@@ -0,0 +1,96 @@
+"""
+Event Bus - Shares WebSocket notifications between API workers
+
+Enabled by setting REDIS_URL (or CELERY_BROKER_URL). Each API worker
+publishes its notifications to one Redis channel and relays everything
+on the channel to its own WebSocket clients, so a client sees the same
+events whichever worker it is connected to. Celery workers publish task
+completion events on the same channel.
+"""
+
+from typing import Awaitable, Callable
+import asyncio
+import logging
+import os
+
+import redis
+import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+EVENTS_URL = (
+    os.environ.get("REDIS_URL")
+    or os.environ.get("CELERY_BROKER_URL", "redis://localhost:6379/0")
+)
+
+# Redis channel carrying JSON notifications to every API worker
+EVENTS_CHANNEL = "greenpulse:events"
+
+# Seconds to wait before resubscribing after the connection drops
+RECONNECT_DELAY = 1.0
+
+# Seconds a publish may take before the payload is delivered locally
+# instead; also bounds connecting to Redis
+PUBLISH_TIMEOUT = 0.25
+
+# Payloads waiting to be published before new ones are delivered locally
+OUTBOX_SIZE = 1000
+
+
+class EventBus:
+    """Publishes JSON payloads to the events channel and relays them back."""
+    
+    def __init__(self, url: str = EVENTS_URL):
+        # Publishes must fail fast; the subscription idles between
+        # events, so only its connect is bounded
+        self._publisher = aioredis.from_url(
+            url, socket_connect_timeout=PUBLISH_TIMEOUT, socket_timeout=PUBLISH_TIMEOUT
+        )
+        self._subscriber = aioredis.from_url(
+            url, socket_connect_timeout=PUBLISH_TIMEOUT, socket_keepalive=True
+        )
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=OUTBOX_SIZE)
+    
+    def publish(self, payload: str) -> bool:
+        """
+        Queue a payload for publishing without waiting on Redis.
+        Returns False when the outbox is full.
+        """
+        try:
+            self._outbox.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            return False
+    
+    async def run_publisher(self, fallback: Callable[[str], Awaitable[None]]) -> None:
+        """Publish queued payloads in order, handing any Redis rejects to fallback()."""
+        while True:
+            payload = await self._outbox.get()
+            try:
+                await self._publisher.publish(EVENTS_CHANNEL, payload)
+            except (redis.RedisError, OSError, asyncio.TimeoutError) as e:
+                logger.warning("Could not publish event: %s", e)
+                await fallback(payload)
+    
+    async def relay(self, deliver: Callable[[str], Awaitable[None]]) -> None:
+        """Pass every payload on the channel to deliver(), resubscribing as needed."""
+        while True:
+            pubsub = self._subscriber.pubsub()
+            try:
+                await pubsub.subscribe(EVENTS_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        await deliver(message["data"].decode())
+                    except Exception:
+                        logger.exception("Could not deliver event")
+            except Exception as e:
+                logger.warning("Event relay lost its connection: %s", e)
+            finally:
+                await pubsub.close()
+            await asyncio.sleep(RECONNECT_DELAY)
+    
+    async def aclose(self) -> None:
+        await self._publisher.close()
+        await self._subscriber.close()
@@ -0,0 +1,687 @@
+"""
+FastAPI Backend for GreenPulse AI
+
+Main API server providing endpoints for:
+- Credit assessment
+- Portfolio optimization
+- Micro-loan processing
+- Greenwashing detection
+- Real-time data streaming
+"""
+
+from fastapi import FastAPI, Header, HTTPException, Response, WebSocket, WebSocketDisconnect
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.websockets import WebSocketState
+from pydantic import BaseModel, ConfigDict, Field
+from typing import AsyncIterator, Dict, List, Any, Optional, Set, Tuple
+import asyncio
+from contextlib import asynccontextmanager
+import hashlib
+import logging
+import math
+from datetime import datetime
+import sys
+import os
+
+import orjson
+
+from greenpulse.agents.cache import TTLCache
+from greenpulse.agents.clock import now
+
+# Deferred requests run on Celery workers when a broker is configured
+if os.environ.get("CELERY_BROKER_URL"):
+    from kombu.exceptions import OperationalError as BrokerError
+    
+    from greenpulse.api import tasks
+else:
+    tasks = None
+
+# With Redis available, WebSocket notifications reach clients on every
+# worker process, not just the one that handled the request
+if os.environ.get("REDIS_URL") or os.environ.get("CELERY_BROKER_URL"):
+    from greenpulse.api import events
+else:
+    events = None
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Master Agent configuration
+config = {
+    "api_keys": {},
+    "data_sources": {},
+    "models": {}
+}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Create the Master Agent and background tasks when the server starts,
+    and shut them down when it stops. Importing the agents here rather
+    than at module level keeps worker startup fast.
+    """
+    from greenpulse.agents import MasterAgent
+    
+    async with MasterAgent(config) as master_agent:
+        app.state.master_agent = master_agent
+        
+        # Relay events published by any API or task worker to this
+        # worker's WebSocket clients
+        background = []
+        if events is not None:
+            manager.event_bus = events.EventBus()
+            background.append(asyncio.create_task(
+                manager.event_bus.run_publisher(manager.broadcast_payload)
+            ))
+            background.append(asyncio.create_task(
+                manager.event_bus.relay(manager.broadcast_payload)
+            ))
+        
+        try:
+            yield
+        finally:
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+            if manager.event_bus is not None:
+                await manager.event_bus.aclose()
+                manager.event_bus = None
+
+
+# Initialize FastAPI app
+app = FastAPI(
+    title="GreenPulse AI API",
+    description="Carbon Footprint-Driven Intelligent Financial Ecosystem",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# CORS middleware. Explicit allowlists keep the middleware off its
+# wildcard path; set CORS_ORIGINS (comma-separated) in production
+CORS_ORIGINS = frozenset(
+    origin.strip()
+    for origin in os.environ.get(
+        "CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000"
+    ).split(",")
+    if origin.strip()
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=("GET", "POST"),
+    allow_headers=("authorization", "content-type", "if-none-match"),
+    # Cross-origin scripts can only read the ETag they must send back
+    # in If-None-Match when it is exposed
+    expose_headers=("ETag",),
+)
+
+# Clients handed a broadcast per event-loop turn
+BROADCAST_BATCH_SIZE = 50
+
+# Broadcasts buffered for a client before it is dropped as too slow
+OUTBOUND_QUEUE_SIZE = 1000
+
+# Fixed-shape WebSocket notifications, filled with JSON-encoded values
+CREDIT_ASSESSED_TEMPLATE = (
+    '{{"type":"credit_assessment_complete","entity_id":{entity_id},'
+    '"timestamp":"{timestamp}"}}'
+)
+PORTFOLIO_OPTIMIZED_TEMPLATE = (
+    '{{"type":"portfolio_optimized","capital":{capital},"timestamp":"{timestamp}"}}'
+)
+LOAN_PROCESSED_TEMPLATE = (
+    '{{"type":"loan_processed","applicant_id":{applicant_id},'
+    '"approved":{approved},"timestamp":"{timestamp}"}}'
+)
+GREENWASHING_CHECKED_TEMPLATE = (
+    '{{"type":"greenwashing_check_complete","company_id":{company_id},'
+    '"risk_index":{risk_index},"timestamp":"{timestamp}"}}'
+)
+
+# Portfolio results shared by requests in the same bucket for 5 minutes
+portfolio_cache = TTLCache(ttl=300, maxsize=1024)
+
+# How long clients may reuse a greenwashing result, and the ETag of the
+# latest result per company, for answering If-None-Match with 304
+GREENWASHING_MAX_AGE = 60
+greenwashing_etags = TTLCache(ttl=GREENWASHING_MAX_AGE, maxsize=1024)
+
+# WebSocket connection manager
+class ConnectionManager:
+    def __init__(self):
+        self.active_connections: Set[WebSocket] = set()
+        # Outbound payloads and the writer task draining them, per client
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        self._closing: Set[asyncio.Task] = set()
+        # Redis event bus shared by all workers, when configured
+        self.event_bus: Optional["events.EventBus"] = None
+    
+    async def connect(self, websocket: WebSocket):
+        await websocket.accept()
+        self.active_connections.add(websocket)
+        queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self._queues[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
+    
+    def disconnect(self, websocket: WebSocket):
+        # A failed send or a full queue may already have dropped this client
+        self.active_connections.discard(websocket)
+        self._queues.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+    
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        # One long-lived sender per client, so a slow client only delays itself
+        try:
+            while True:
+                await websocket.send_text(await queue.get())
+        except Exception:
+            self.disconnect(websocket)
+    
+    def _drop_slow_client(self, websocket: WebSocket):
+        self.disconnect(websocket)
+        closing = asyncio.create_task(self._close(websocket))
+        self._closing.add(closing)
+        closing.add_done_callback(self._closing.discard)
+    
+    async def _close(self, websocket: WebSocket):
+        try:
+            await websocket.close(code=1013)  # Try again later
+        except Exception:
+            pass
+    
+    async def publish(self, payload: str):
+        # Through the event bus every worker, this one included, relays
+        # the payload to its clients; the publish itself happens in the
+        # background. Without a bus, or if Redis is unreachable or backed
+        # up, only this worker's clients get it
+        if self.event_bus is None or not self.event_bus.publish(payload):
+            await self.broadcast_payload(payload)
+    
+    async def broadcast_payload(self, payload: str):
+        # Deliver to this worker's clients. payload is already JSON; text
+        # frames keep browser clients' JSON.parse(event.data) working
+        
+        # Hand the payload to each open client's writer. Yield between
+        # batches so large fan-outs don't starve HTTP requests
+        closed = []
+        slow = []
+        connections = list(self.active_connections)
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            for connection in connections[start:start + BROADCAST_BATCH_SIZE]:
+                queue = self._queues.get(connection)
+                if (
+                    queue is None
+                    or connection.client_state != WebSocketState.CONNECTED
+                ):
+                    closed.append(connection)
+                elif queue.full():
+                    slow.append(connection)
+                else:
+                    queue.put_nowait(payload)
+        
+        # Prune clients that went away and drop those too far behind
+        for connection in closed:
+            self.disconnect(connection)
+        if slow:
+            logger.warning("Dropping %d WebSocket clients that cannot keep up", len(slow))
+            for connection in slow:
+                self._drop_slow_client(connection)
+
+manager = ConnectionManager()
+
+
+def json_value(value: Any) -> str:
+    """Encode one value for a notification template."""
+    return orjson.dumps(value).decode()
+
+
+def json_response(
+    result: Dict[str, Any],
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Serialize an agent result with orjson. Returning a response directly
+    also skips FastAPI's response_model validation pass.
+    """
+    return ORJSONResponse(result, status_code=status_code, headers=headers)
+
+
+def portfolio_bucket(request: "PortfolioOptimizationRequest") -> Tuple:
+    """
+    Group portfolio requests that get the same allocation: capital to a
+    tenth of an order of magnitude, risk tolerance, whole-percent target.
+    """
+    return (
+        round(math.log10(request.capital), 1),
+        request.risk_tolerance,
+        round(request.target_return * 100)
+    )
+
+
+def rescale_portfolio_result(result: Dict[str, Any], capital: float) -> Dict[str, Any]:
+    """
+    Copy a cached portfolio result with its monetary values set for
+    capital. Allocations, returns and carbon figures do not depend on it.
+    """
+    rescaled = dict(result)
+    for key in ("traditional_portfolio", "green_portfolio"):
+        portfolio = result.get(key)
+        if not portfolio or "total_value" not in portfolio:
+            continue
+        rescaled[key] = {
+            **portfolio,
+            "total_value": capital,
+            "assets": [
+                {**asset, "value": round(capital * asset["allocation"], 2)}
+                for asset in portfolio["assets"]
+            ]
+        }
+    return rescaled
+
+
+async def enqueue_request(request_type: str, params: Dict[str, Any]) -> Response:
+    """Hand a request to the task queue and answer 202 with its task id."""
+    if tasks is None:
+        raise HTTPException(status_code=503, detail="Task queue is not configured")
+    
+    # Publishing to the broker is a blocking call
+    try:
+        task = await asyncio.to_thread(tasks.run_agent.delay, request_type, params)
+    except BrokerError as e:
+        logger.error(f"Error queueing {request_type} request: {str(e)}")
+        raise HTTPException(status_code=503, detail="Task queue is unavailable")
+    return json_response({"task_id": task.id, "status": "queued"}, status_code=202)
+
+
+# Request/Response Models
+# Request bodies are validated once by pydantic-core and never modified:
+# unknown fields are dropped rather than stored, identifiers are stripped
+REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
+
+class CreditAssessmentRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
+    entity_id: str = Field(..., description="Unique identifier for entity")
+    entity_type: str = Field(default="company", description="Type: company or individual")
+
+
+class PortfolioOptimizationRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
+    capital: float = Field(..., gt=0, description="Initial investment capital")
+    risk_tolerance: str = Field(default="moderate", description="Risk level: conservative, moderate, aggressive")
+    target_return: float = Field(default=0.08, description="Target annual return rate")
+
+
+class MicroLoanRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
+    applicant_id: str = Field(..., description="Applicant identifier")
+    amount: float = Field(..., gt=0, description="Requested loan amount")
+    purpose: str = Field(default="business", description="Loan purpose")
+    mobile_payment_history: Optional[List[Dict]] = None
+    green_activities: Optional[Dict] = None
+    social_data: Optional[Dict] = None
+
+
+class GreenwashingCheckRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
+    company_id: str = Field(..., description="Company identifier")
+
+
+# Response models document the agent results in the OpenAPI schema.
+# Endpoints return ready-made responses, so they are not re-validated
+RESPONSE_MODEL_CONFIG = ConfigDict(extra="allow")
+
+
+class SystemStatusResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    timestamp: datetime
+    agents: Dict[str, str]
+    queue_size: int
+    cache_size: int
+    status: str
+
+
+class CreditAssessmentResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    entity_id: str
+    timestamp: datetime
+    carbon_score: float
+    risk_analysis: Dict[str, Any]
+    credit_rating: Dict[str, Any]
+    recommendations: List[str]
+    status: str
+
+
+class PortfolioOptimizationResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    timestamp: datetime
+    traditional_portfolio: Dict[str, Any]
+    green_portfolio: Dict[str, Any]
+    carbon_comparison: Dict[str, float]
+    recommendations: str
+    status: str
+
+
+class MicroLoanResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    applicant_id: str
+    timestamp: datetime
+    assessment: Dict[str, Any]
+    loan_terms: Dict[str, Any]
+    approval_status: bool
+    status: str
+
+
+class GreenwashingCheckResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    company_id: str
+    timestamp: datetime
+    greenwashing_risk_index: float
+    anomalies: List[Dict[str, Any]]
+    recommendations: List[str]
+    status: str
+
+
+# API Endpoints
+@app.get("/")
+async def root():
+    """Root endpoint with API information."""
+    return {
+        "name": "GreenPulse AI API",
+        "version": "1.0.0",
+        "status": "operational",
+        "timestamp": now().isoformat(),
+        "endpoints": {
+            "credit_assessment": "/api/v1/credit/assess",
+            "portfolio_optimization": "/api/v1/portfolio/optimize",
+            "micro_loan": "/api/v1/loan/apply",
+            "greenwashing_check": "/api/v1/greenwashing/check",
+            "system_status": "/api/v1/system/status"
+        }
+    }
+
+
+@app.get("/api/v1/system/status", response_model=SystemStatusResponse)
+async def get_system_status():
+    """Get current system status and agent health."""
+    try:
+        status = await app.state.master_agent.get_system_status()
+        return json_response(status)
+    except Exception as e:
+        logger.error(f"Error getting system status: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/v1/credit/assess", response_model=CreditAssessmentResponse)
+async def assess_credit(request: CreditAssessmentRequest, defer: bool = False):
+    """
+    Assess credit using real-time carbon footprint data.
+    
+    Returns comprehensive credit rating combining traditional
+    financial metrics with carbon performance.
+    """
+    params = {
+        "entity_id": request.entity_id,
+        "entity_type": request.entity_type
+    }
+    if defer:
+        return await enqueue_request("credit_assessment", params)
+    
+    try:
+        logger.info(f"Credit assessment request for: {request.entity_id}")
+        
+        result = await app.state.master_agent.process_request("credit_assessment", params)
+        
+        # Broadcast update via WebSocket
+        await manager.publish(CREDIT_ASSESSED_TEMPLATE.format(
+            entity_id=json_value(request.entity_id),
+            timestamp=now().isoformat()
+        ))
+        
+        return json_response(result)
+        
+    except Exception as e:
+        logger.error(f"Error in credit assessment: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/v1/portfolio/optimize", response_model=PortfolioOptimizationResponse)
+async def optimize_portfolio(request: PortfolioOptimizationRequest, defer: bool = False):
+    """
+    Generate optimized investment portfolio with carbon neutrality path.
+    
+    Returns both traditional and green portfolio options with
+    comparative carbon impact analysis.
+    """
+    params = {
+        "capital": request.capital,
+        "risk_tolerance": request.risk_tolerance,
+        "target_return": request.target_return
+    }
+    if defer:
+        return await enqueue_request("portfolio_optimization", params)
+    
+    try:
+        logger.info(f"Portfolio optimization request: ${request.capital}")
+        
+        # Requests in the same bucket share one computed allocation
+        bucket = portfolio_bucket(request)
+        hit, cached_result = portfolio_cache.get(bucket)
+        if hit:
+            result = rescale_portfolio_result(cached_result, request.capital)
+        else:
+            result = await app.state.master_agent.process_request("portfolio_optimization", params)
+            if result.get("status") == "success":
+                portfolio_cache.set(bucket, result)
+        
+        await manager.publish(PORTFOLIO_OPTIMIZED_TEMPLATE.format(
+            capital=json_value(request.capital),
+            timestamp=now().isoformat()
+        ))
+        
+        return json_response(result)
+        
+    except Exception as e:
+        logger.error(f"Error in portfolio optimization: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/v1/loan/apply", response_model=MicroLoanResponse)
+async def apply_micro_loan(request: MicroLoanRequest, defer: bool = False):
+    """
+    Process micro-loan application using alternative data sources.
+    
+    Enables financial access for underserved communities through
+    non-traditional credit assessment.
+    """
+    params = {
+        "applicant_id": request.applicant_id,
+        "amount": request.amount,
+        "purpose": request.purpose,
+        "mobile_payment_history": request.mobile_payment_history or [],
+        "green_activities": request.green_activities or {},
+        "social_data": request.social_data or {}
+    }
+    if defer:
+        return await enqueue_request("micro_loan", params)
+    
+    try:
+        logger.info(f"Micro-loan application: {request.applicant_id}")
+        
+        result = await app.state.master_agent.process_request("micro_loan", params)
+        
+        await manager.publish(LOAN_PROCESSED_TEMPLATE.format(
+            applicant_id=json_value(request.applicant_id),
+            approved=json_value(result.get("approval_status", False)),
+            timestamp=now().isoformat()
+        ))
+        
+        return json_response(result)
+        
+    except Exception as e:
+        logger.error(f"Error processing micro-loan: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/v1/greenwashing/check", response_model=GreenwashingCheckResponse)
+async def check_greenwashing(
+    request: GreenwashingCheckRequest,
+    defer: bool = False,
+    if_none_match: Optional[str] = Header(default=None)
+):
+    """
+    Detect potential greenwashing by analyzing discrepancies
+    between corporate claims and actual carbon performance.
+    
+    Responses carry an ETag; a client sending it back in If-None-Match
+    gets 304 Not Modified while the result is unchanged.
+    """
+    params = {"company_id": request.company_id}
+    if defer:
+        return await enqueue_request("greenwashing_check", params)
+    
+    cache_headers = {"Cache-Control": f"max-age={GREENWASHING_MAX_AGE}"}
+    hit, etag = greenwashing_etags.get(request.company_id)
+    if hit and if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag, **cache_headers})
+    
+    try:
+        logger.info(f"Greenwashing check for: {request.company_id}")
+        
+        result = await app.state.master_agent.process_request("greenwashing_check", params)
+        body = orjson.dumps(result)
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        if result.get("status") == "success":
+            greenwashing_etags.set(request.company_id, etag)
+        
+        await manager.publish(GREENWASHING_CHECKED_TEMPLATE.format(
+            company_id=json_value(request.company_id),
+            risk_index=json_value(result.get("greenwashing_risk_index", 0)),
+            timestamp=now().isoformat()
+        ))
+        
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag, **cache_headers})
+        return Response(
+            body,
+            headers={"ETag": etag, **cache_headers},
+            media_type="application/json"
+        )
+        
+    except Exception as e:
+        logger.error(f"Error in greenwashing check: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/v1/tasks/{task_id}")
+async def get_task(task_id: str):
+    """
+    Look up a deferred request.
+    
+    Returns the task state, plus the result once it has succeeded
+    or the error once it has failed.
+    """
+    if tasks is None:
+        raise HTTPException(status_code=503, detail="Task queue is not configured")
+    
+    task = tasks.celery_app.AsyncResult(task_id)
+    # The result backend is read with blocking calls
+    state, value = await asyncio.to_thread(lambda: (task.state, task.result))
+    
+    body = {"task_id": task_id, "status": state.lower()}
+    if state == "SUCCESS":
+        body["result"] = value
+    elif state == "FAILURE":
+        body["error"] = str(value)
+    return json_response(body)
+
+
+@app.websocket("/ws")
+async def websocket_endpoint(websocket: WebSocket):
+    """
+    WebSocket endpoint for real-time data streaming.
+    
+    Clients can connect to receive live updates on:
+    - Credit assessments
+    - Portfolio changes
+    - Market data
+    - System alerts
+    """
+    await manager.connect(websocket)
+    try:
+        while True:
+            # Keep connection alive and handle incoming messages. The raw
+            # receive takes text and binary frames as they come, without
+            # receive_text()'s decode
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            
+            if logger.isEnabledFor(logging.INFO):
+                data = message.get("bytes")
+                if data is not None:
+                    data = data[:256].decode("utf-8", "replace")
+                else:
+                    data = (message.get("text") or "")[:256]
+                logger.info("Received WebSocket message: %s", data)
+            
+            # Echo back for now
+            await websocket.send_json({
+                "type": "acknowledgment",
+                "message": "Message received",
+                "timestamp": now().isoformat()
+            })
+            
+    except WebSocketDisconnect:
+        manager.disconnect(websocket)
+        logger.info("WebSocket client disconnected")
+
+
+@app.get("/api/v1/health")
+async def health_check():
+    """Health check endpoint for monitoring."""
+    return {
+        "status": "healthy",
+        "timestamp": now().isoformat(),
+        "version": "1.0.0"
+    }
+
+
+if __name__ == "__main__":
+    # Development server. In production run several workers, e.g.
+    # gunicorn greenpulse.api.main:app -k uvicorn.workers.UvicornWorker -w 4
+    # with REDIS_URL set so broadcasts reach clients on every worker
+    import uvicorn
+    uvicorn.run(
+        "greenpulse.api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        # uvloop (shipped with uvicorn[standard]) is not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        log_level="info"
+    )
@@ -0,0 +1,107 @@
+"""
+Task Queue - Runs agent requests on Celery workers
+
+Enabled by setting CELERY_BROKER_URL to a Redis URL. API endpoints
+called with ?defer=true enqueue their request here and answer 202 with
+a task id; results are read back through the result backend, and each
+worker announces finished tasks on the event bus channel, which the API
+relays to its WebSocket clients.
+
+Start a worker with:
+    celery -A greenpulse.api.tasks worker
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+import asyncio
+import logging
+from datetime import datetime
+import os
+
+import orjson
+import redis
+from celery import Celery
+from celery.signals import worker_process_shutdown
+
+from greenpulse.api.events import EVENTS_CHANNEL, EVENTS_URL
+
+if TYPE_CHECKING:
+    from greenpulse.agents import MasterAgent
+
+logger = logging.getLogger(__name__)
+
+BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://localhost:6379/0")
+RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", BROKER_URL)
+
+celery_app = Celery("greenpulse", broker=BROKER_URL, backend=RESULT_BACKEND)
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    result_expires=3600
+)
+
+# One agent and event loop per worker process, so the agent's HTTP
+# session and caches survive across tasks
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_master_agent: Optional["MasterAgent"] = None
+_publisher: Optional[redis.Redis] = None
+
+
+def _worker_agent() -> "MasterAgent":
+    global _loop, _master_agent
+    if _master_agent is None:
+        # Imported here so the API, which imports this module to enqueue
+        # tasks, doesn't load the agents at startup
+        from greenpulse.agents import MasterAgent
+        
+        _loop = asyncio.new_event_loop()
+        _master_agent = MasterAgent({
+            "api_keys": {},
+            "data_sources": {},
+            "models": {}
+        })
+    return _master_agent
+
+
+@worker_process_shutdown.connect
+def _close_worker_agent(**kwargs: Any) -> None:
+    """Close the worker's agent, its HTTP sessions and its event loop."""
+    global _loop, _master_agent, _publisher
+    if _master_agent is not None:
+        _loop.run_until_complete(_master_agent.aclose())
+        _loop.close()
+        _loop = None
+        _master_agent = None
+    if _publisher is not None:
+        _publisher.close()
+        _publisher = None
+
+
+def _publish(event: Dict[str, Any]) -> None:
+    global _publisher
+    try:
+        if _publisher is None:
+            _publisher = redis.Redis.from_url(EVENTS_URL)
+        _publisher.publish(EVENTS_CHANNEL, orjson.dumps(event))
+    except redis.RedisError as e:
+        logger.warning("Could not publish task event: %s", e)
+
+
+@celery_app.task(name="greenpulse.run_agent", bind=True)
+def run_agent(self, request_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Process one agent request on a worker and announce its completion."""
+    master_agent = _worker_agent()
+    result = _loop.run_until_complete(
+        master_agent.process_request(request_type, params)
+    )
+    
+    _publish({
+        "type": "task_complete",
+        "task_id": self.request.id,
+        "request_type": request_type,
+        "status": result.get("status", "success"),
+        "timestamp": datetime.now().isoformat()
+    })
+    
+    # Round-trip through orjson so datetimes reach the JSON result backend as strings
+    return orjson.loads(orjson.dumps(result))